@@ -282,11 +282,9 @@ def save_csv_dithers(dbs_path, outDir, db_files_only=None,
             print('\nSaved the dithers in %s'%filename)
             print('Time taken: %.2f (min)\n\n'%((time.time()-startTime)/60.))
 
-        readme_file= open('%s/readme.txt'%(outDir), 'a')
-        readme_file.write(readme)
-        readme_file.close()
+        with open('%s/readme.txt'%(outDir), 'a') as readme_file:
+            readme_file.write(readme)
 
     # mark the end in the readme.
-    readme_file= open('%s/readme.txt'%(outDir), 'a')
-    readme_file.write('All done. Total time taken: %.2f (min)\n\n'%((time.time()-startTime_0)/60.))
-    readme_file.close()
\ No newline at end of file
+    with open('%s/readme.txt'%(outDir), 'a') as readme_file:
+        readme_file.write('All done. Total time taken: %.2f (min)\n\n'%((time.time()-startTime_0)/60.))
\ No newline at end of file